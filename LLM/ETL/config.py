@@ -1,4 +1,5 @@
-import json
+import functools
+import orjson
 import pathlib
 
 PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[2]
@@ -6,8 +7,8 @@ PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[2]
 CONFIG_PATH = pathlib.Path(__file__).parent / "config.json"
 
 def load_config():
-    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # Parsed exactly once at import; orjson decodes the raw bytes in C.
+    return orjson.loads(CONFIG_PATH.read_bytes())
 
 CONFIG = load_config()
 
@@ -17,12 +18,14 @@ def get_absolute_path(rel_path):
     """
     return (PROJECT_ROOT / rel_path).resolve()
 
+@functools.lru_cache(maxsize=None)
 def get_source_config(source_key):
     """
     Get the config dict for a given source (e.g., 'noaa_swpc').
     """
     return CONFIG[source_key]
 
+@functools.lru_cache(maxsize=None)
 def get_input_path(source_key):
     """
     Get the absolute path to the input file for a source.
@@ -31,6 +34,7 @@ def get_input_path(source_key):
     filename = CONFIG[source_key]["output_filename"]
     return get_absolute_path(rel_path) / filename
 
+@functools.lru_cache(maxsize=None)
 def get_output_path(source_key, output_name=None):
     """
     Get the absolute output path for a source (or specific name).
@@ -39,18 +43,21 @@ def get_output_path(source_key, output_name=None):
     filename = output_name if output_name else CONFIG[source_key]["output_filename"]
     return get_absolute_path(rel_path) / filename
 
+@functools.lru_cache(maxsize=None)
 def get_unique_key(source_key):
     """
     Get the unique key field name for a given source.
     """
     return CONFIG[source_key].get("unique_key")
 
+@functools.lru_cache(maxsize=None)
 def get_timestamp_format(source_key):
     """
     Get the timestamp format string for a given source.
     """
     return CONFIG[source_key].get("timestamp_format")
 
+@functools.lru_cache(maxsize=None)
 def get_incremental_flag(source_key):
     """
     Retrieve the 'incremental' boolean flag from config.json.
@@ -13,23 +13,68 @@ It performs the following tasks:
 Intended to be called from a main controller script managing multiple data sources.
 """
 
-import os
-import requests
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
 from pathlib import Path
 from datetime import datetime, timezone
-from utils import save_json
-from config import get_source_config, get_timestamp_format
-import tarfile
-import tempfile
-import xml.etree.ElementTree as ET
-import shutil
+from fetchers.base_fetcher import BaseFetcher
+from http_session import get_session
+import orjson
+from lxml import etree
 
 
-class AEMETFetcher:
+def _parse_alert_payload(xml_bytes):
+    """
+    Worker helper for the parse pool: parse one extracted CAP XML payload.
+
+    Returns an (alert, error) pair so one malformed file is reported by the
+    caller instead of aborting the whole executor.map batch.
+    """
+    try:
+        return AEMETFetcher.parse_alert(xml_bytes), None
+    except Exception as e:
+        return None, str(e)
+
+
+class AEMETFetcher(BaseFetcher):
     """Fetcher class to retrieve AEMET weather alerts and store them locally."""
 
-    def __init__(self, config=None, source_key="aemet"):
+    source_key = "aemet"
+    log_tag = "[AEMET]"
+    default_unique_key = "identifier"
+
+    # CAP namespace and XPath expressions compiled once at class load;
+    # lxml runs them in libxml2 C code instead of re-resolving the
+    # namespace per findtext call.
+    _NS = {"cap": "urn:oasis:names:tc:emergency:cap:1.2"}
+    _XPATHS = {
+        "identifier": etree.XPath("string(cap:identifier)", namespaces=_NS),
+        "sender": etree.XPath("string(cap:sender)", namespaces=_NS),
+        "sent": etree.XPath("string(cap:sent)", namespaces=_NS),
+        "status": etree.XPath("string(cap:status)", namespaces=_NS),
+        # solo español (primer bloque cap:info)
+        "event": etree.XPath("string(cap:info[1]/cap:event)", namespaces=_NS),
+        "urgency": etree.XPath("string(cap:info[1]/cap:urgency)", namespaces=_NS),
+        "severity": etree.XPath("string(cap:info[1]/cap:severity)", namespaces=_NS),
+        "certainty": etree.XPath("string(cap:info[1]/cap:certainty)", namespaces=_NS),
+        "onset": etree.XPath("string(cap:info[1]/cap:onset)", namespaces=_NS),
+        "expires": etree.XPath("string(cap:info[1]/cap:expires)", namespaces=_NS),
+        "headline": etree.XPath("string(cap:info[1]/cap:headline)", namespaces=_NS),
+        "description": etree.XPath("string(cap:info[1]/cap:description)", namespaces=_NS),
+        "instruction": etree.XPath("string(cap:info[1]/cap:instruction)", namespaces=_NS),
+        "area": etree.XPath("string(cap:info[1]/cap:area/cap:areaDesc)", namespaces=_NS),
+    }
+    # The three AEMET-Meteoalerta parameters are collected in one linear scan
+    # over cap:parameter instead of a predicate XPath per field.
+    _XP_PARAMS = etree.XPath("cap:info[1]/cap:parameter", namespaces=_NS)
+    _PARAM_MAP = {
+        "AEMET-Meteoalerta nivel": "level",
+        "AEMET-Meteoalerta parametro": "parameter",
+        "AEMET-Meteoalerta probabilidad": "probability",
+    }
+
+    def __init__(self, config=None, source_key=None):
         """
         Initialize AEMETFetcher with configuration settings.
         
@@ -37,15 +82,8 @@ class AEMETFetcher:
             config (dict): Optional global config dictionary. If None, it will use get_source_config.
             source_key (str): Key identifying the source in config.
         """
-        # Allow passing a preloaded config or fallback to get_source_config
-        self.source_key = source_key
-        self.config = config[source_key] if config and source_key in config else get_source_config(source_key)
-        self.url = self.config["url"]
-        self.base_path = self.config["base_data_path"] 
-        self.output = self.config["output_filename"]
+        super().__init__(config, source_key)
         self.token = self.config["token"]
-        self.timestamp_format = get_timestamp_format(source_key)
-        self.unique_key = self.config.get("unique_key", "identifier")
         
     def fetch(self, incremental: bool = True):
         """Fetch AEMET alerts using the provided API token and store them locally.
@@ -53,12 +91,15 @@ class AEMETFetcher:
         Args:
             incremental (bool): If True, also save an incremental JSON file of new alerts.
         """
+        # Only needed on the actual fetch path, so keep it off module import.
+        import tarfile
+
         try:
             # First request to get the actual data URL
             headers = {"accept": "application/json", "api_key": self.token}
-            initial_response = requests.get(self.url, headers=headers, timeout=10)
+            initial_response = get_session().get(self.url, headers=headers, timeout=10)
             initial_response.raise_for_status()
-            response_json = initial_response.json()
+            response_json = orjson.loads(initial_response.content)
 
             data_url = response_json.get("datos")
             if not data_url:
@@ -66,86 +107,57 @@ class AEMETFetcher:
                 return
 
             # Second request to get actual alert data
-            data_response = requests.get(data_url, timeout=10)
+            data_response = get_session().get(data_url, timeout=10)
             data_response.raise_for_status()
-            #data = data_response.json()
-            # Guardar temporalmente
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".tar.gz") as tmp_tar:
-                tmp_tar.write(data_response.content)
-                tar_path = tmp_tar.name
-
-            # Extraer
-            extract_path = Path("data/aemet_extracted")
-            extract_path.mkdir(parents=True, exist_ok=True)
-            with tarfile.open(tar_path, "r:") as tar:
-                tar.extractall(path=extract_path)
+            # Extraer en memoria: el tar de AEMET son muchos XML pequeños,
+            # así que no hace falta pasar por disco.
+            members = []
+            with tarfile.open(fileobj=BytesIO(data_response.content), mode="r:") as tar:
+                for member in tar:
+                    if not member.name.endswith(".xml"):
+                        continue
+                    extracted = tar.extractfile(member)
+                    if extracted is not None:
+                        members.append((member.name, extracted.read()))
+
+            # XML parsing is CPU-bound and per-file independent, so large
+            # bundles are spread across cores; small ones stay sequential to
+            # avoid paying the pool spawn overhead.
+            if len(members) >= 8:
+                with ProcessPoolExecutor() as executor:
+                    results = list(executor.map(
+                        _parse_alert_payload, (payload for _, payload in members), chunksize=16))
+            else:
+                results = [_parse_alert_payload(payload) for _, payload in members]
 
             new_alerts = []
-            for xml_file in extract_path.glob("*.xml"):
-                try:
-                    alert = self.parse_alert(xml_file)
+            for (member_name, _), (alert, error) in zip(members, results):
+                if error is not None:
+                    logging.warning(f"[AEMET] Skipping file {member_name} due to parsing error: {error}")
+                else:
                     new_alerts.append(alert)
-                except Exception as e:
-                    logging.warning(f"[AEMET] Skipping file {xml_file.name} due to parsing error: {e}")
 
             if new_alerts:
-                full_output_path = Path(self.base_path) / self.output
-                save_json(new_alerts, full_output_path, unique_key=self.unique_key)
+                self._save_alerts(new_alerts, incremental)
                 logging.info(f"[AEMET] Saved {len(new_alerts)} alerts to {self.output}")
-
-                if incremental:
-                    # Also save (overwrite) an incremental JSON of new alerts
-                    incremental_dir = Path(self.config.get("incremental_output_dir", self.base_path)) / "incremental"
-                    incremental_dir.mkdir(parents=True, exist_ok=True)
-                    # Use the same output filename to overwrite previous incremental file
-                    inc_file = incremental_dir / self.output
-                    save_json(new_alerts, inc_file)
-                    logging.info(f"[AEMET] Overwrote incremental alerts file {inc_file.name}")
             else:
                 logging.info("[AEMET] No new alerts to save.")
 
-            # Clean up extracted XML directory and downloaded tar file
-            try:
-                shutil.rmtree(extract_path)
-                os.remove(tar_path)
-            except Exception as cleanup_err:
-                logging.warning(f"[AEMET] Cleanup failed: {cleanup_err}")
-
         except Exception as e:
             status = getattr(e.response, 'status_code', 'N/A') if hasattr(e, 'response') else 'N/A'
             logging.error(
                 f"[AEMET] Error fetching from {self.url} | Status: {status} | Exception: {e}"
             )
 
-    @staticmethod
-    def parse_alert(xml_path):
-                ns = {"cap": "urn:oasis:names:tc:emergency:cap:1.2"}
-                tree = ET.parse(xml_path)
-                root = tree.getroot()
-                info = root.findall("cap:info", ns)[0]  # solo español
-
-                return {
-                    "identifier": root.findtext("cap:identifier", default="", namespaces=ns),
-                    "sender": root.findtext("cap:sender", default="", namespaces=ns),
-                    "sent": root.findtext("cap:sent", default="", namespaces=ns),
-                    "status": root.findtext("cap:status", default="", namespaces=ns),
-                    "event": info.findtext("cap:event", default="", namespaces=ns),
-                    "urgency": info.findtext("cap:urgency", default="", namespaces=ns),
-                    "severity": info.findtext("cap:severity", default="", namespaces=ns),
-                    "certainty": info.findtext("cap:certainty", default="", namespaces=ns),
-                    "onset": info.findtext("cap:onset", default="", namespaces=ns),
-                    "expires": info.findtext("cap:expires", default="", namespaces=ns),
-                    "headline": info.findtext("cap:headline", default="", namespaces=ns),
-                    "description": info.findtext("cap:description", default="", namespaces=ns),
-                    "instruction": info.findtext("cap:instruction", default="", namespaces=ns),
-                    "area": info.find("cap:area/cap:areaDesc", ns).text if info.find("cap:area/cap:areaDesc", ns) is not None else "",
-                    "level": next((p.findtext("cap:value", default="", namespaces=ns)
-                                   for p in info.findall("cap:parameter", ns)
-                                   if p.findtext("cap:valueName", default="", namespaces=ns) == "AEMET-Meteoalerta nivel"), ""),
-                    "parameter": next((p.findtext("cap:value", default="", namespaces=ns)
-                                       for p in info.findall("cap:parameter", ns)
-                                       if p.findtext("cap:valueName", default="", namespaces=ns) == "AEMET-Meteoalerta parametro"), ""),
-                    "probability": next((p.findtext("cap:value", default="", namespaces=ns)
-                                         for p in info.findall("cap:parameter", ns)
-                                         if p.findtext("cap:valueName", default="", namespaces=ns) == "AEMET-Meteoalerta probabilidad"), "")
-                }
\ No newline at end of file
+    @classmethod
+    def parse_alert(cls, xml_bytes):
+        """Parse a single in-memory CAP XML document into an alert dict via precompiled XPaths."""
+        root = etree.fromstring(xml_bytes)
+        alert = {name: xpath(root) for name, xpath in cls._XPATHS.items()}
+        alert.update(dict.fromkeys(cls._PARAM_MAP.values(), ""))
+        for param in cls._XP_PARAMS(root):
+            field = cls._PARAM_MAP.get(
+                param.findtext("cap:valueName", default="", namespaces=cls._NS))
+            if field:
+                alert[field] = param.findtext("cap:value", default="", namespaces=cls._NS)
+        return alert
\ No newline at end of file
@@ -0,0 +1,75 @@
+"""
+base_fetcher.py
+
+Shared scaffolding for the source fetchers. Every fetcher resolved the same
+config fields in its __init__ and ended fetch() with the same save block
+(merge into the full output JSON, then overwrite the incremental file), so
+both live here once and subclasses only implement the source-specific
+download and parse steps.
+"""
+
+import logging
+from pathlib import Path
+
+from config import get_source_config, get_timestamp_format
+from utils import save_json
+
+
+class BaseFetcher:
+    """Shared config resolution and output handling for all fetchers."""
+
+    # Overridden by subclasses: the source's key in config and the tag
+    # prefixing its log lines.
+    source_key = None
+    log_tag = ""
+    # Sources whose records carry an explicit identifier field (AEMET,
+    # FIRMS) override this fallback.
+    default_unique_key = None
+
+    def __init__(self, config=None, source_key=None):
+        """Initialize the fetcher from its source config block.
+
+        Args:
+            config (dict): Optional global config dictionary. If None, it will use get_source_config.
+            source_key (str): Key identifying the source in config. Defaults to the class attribute.
+        """
+        if source_key is not None:
+            self.source_key = source_key
+        # Allow passing a preloaded config or fallback to get_source_config
+        self.config = (
+            config[self.source_key]
+            if config and self.source_key in config
+            else get_source_config(self.source_key)
+        )
+        self.url = self.config.get("url")
+        self.base_path = self.config["base_data_path"]
+        self.output = self.config["output_filename"]
+        self.timestamp_format = get_timestamp_format(self.source_key)
+        self.unique_key = self.config.get("unique_key", self.default_unique_key)
+        # Derived once here instead of re-allocating Path objects per fetch.
+        self._full_output_path = Path(self.base_path) / self.output
+        self._incremental_dir = Path(self.config.get("incremental_output_dir", self.base_path)) / "incremental"
+        self._inc_file = self._incremental_dir / self.output
+
+    def _save_alerts(self, alerts, incremental):
+        """
+        Merge alerts into the source's output JSON and, when incremental,
+        overwrite the incremental file with just this run's alerts.
+
+        Args:
+            alerts (list): Alert dicts produced by this run.
+            incremental (bool): Whether to also write the incremental file.
+
+        Returns:
+            Path: Full path to the merged output file.
+        """
+        save_json(alerts, self._full_output_path, unique_key=self.unique_key)
+
+        if incremental:
+            # Also save (overwrite) an incremental JSON of new alerts, using
+            # the same output filename to replace the previous run's file.
+            self._incremental_dir.mkdir(parents=True, exist_ok=True)
+            save_json(alerts, self._inc_file)
+            logging.info(f"{self.log_tag} Overwrote incremental alerts file {self._inc_file.name}")
+
+        return self._full_output_path
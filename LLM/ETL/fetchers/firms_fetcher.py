@@ -6,44 +6,69 @@ Fetcher class to retrieve wildfire alerts from NASA FIRMS (Fire Information for
 - Parses the CSV and stores wildfire events as JSON, grouped by date.
 """
 
-import requests
 import logging
 from pathlib import Path
-from datetime import datetime, timezone
-import pandas as pd
-import io
 import hashlib
-from utils import save_json
-from config import get_source_config, get_timestamp_format
+from io import BytesIO
+from fetchers.base_fetcher import BaseFetcher
+from http_session import get_session
+from state import get_state
+from utils import load_seen_ids, append_seen_ids
 
-class FIRMSFetcher:
+# Only the columns the alert dicts actually use, with narrowed dtypes so
+# pandas skips the rest of the CSV and halves the float width where it is
+# safe. latitude/longitude stay float64 on purpose: their str() repr feeds
+# generate_firms_ids and must keep matching ids stored by earlier runs.
+_CSV_USECOLS = [
+    "latitude", "longitude", "brightness", "confidence", "satellite",
+    "instrument", "daynight", "frp", "acq_date", "acq_time",
+]
+_CSV_DTYPES = {
+    "brightness": "float32",
+    "frp": "float32",
+    "confidence": "category",
+    "satellite": "category",
+    "instrument": "category",
+    "daynight": "category",
+    "acq_time": "int16",
+}
+
+
+class FIRMSFetcher(BaseFetcher):
     """Fetcher class to retrieve and store NASA FIRMS wildfire alerts from CSV."""
 
-    def __init__(self, config=None, source_key="firms"):
+    source_key = "firms"
+    log_tag = "[FIRMS]"
+    default_unique_key = "identifier"
+
+    def __init__(self, config=None, source_key=None):
         """Initialize FIRMSFetcher with configuration.
             
             Args:
                 config (dict): Optional global config dictionary. If None, it will use get_source_config.
                 source_key (str): Key identifying the source in config.
         """
-        # Allow passing a preloaded config or fallback to get_source_config
-        self.source_key = source_key
-        self.config = config[source_key] if config and source_key in config else get_source_config(source_key)
+        super().__init__(config, source_key)
         self.url_template = self.config["url_template"]
         self.map_key = self.config["MAP_KEY"]
         self.source = self.config["SOURCE"]
         self.day_range = self.config["DAY_RANGE"]
-        self.base_path = self.config["base_data_path"] 
-        self.output = self.config["output_filename"]
         self.base_data_path = self.config.get("base_data_path", "data/alertas")
-        self.timestamp_format = get_timestamp_format("firms")
-        self.unique_key = self.config.get("unique_key", "identifier")
+        # Shared per-directory state store: last timestamp and payload hash
+        # used to live in two separate text files read/written every run.
+        self.state = get_state(self.base_path)
+        self.ts_path = Path(self.base_path) / self.config.get("last_timestamp_path", "firms_last_timestamp.txt")
+        self.seen_path = Path(self.base_path) / "firms_seen_ids.txt"
 
     def fetch(self, incremental: bool = True):
         """
         Fetch FIRMS wildfire alerts from CSV, parse, and save as JSON.
         All alerts from the current fetch are stored.
         """
+        # Imported lazily: pandas costs a few hundred ms on cold start and the
+        # controller imports every fetcher even when FIRMS is disabled.
+        import pandas as pd
+
         try:
             # Build the API URL using config and template
             url = self.url_template.format(
@@ -51,73 +76,138 @@ class FIRMSFetcher:
                 SOURCE=self.source,
                 DAY_RANGE=self.day_range
             )
-            r = requests.get(url, timeout=20)
+            r = get_session().get(url, timeout=20)
             r.raise_for_status()
+            payload = r.content
+
+            # Cheap change-detection gate: identical payload bytes mean the
+            # endpoint has no new detections, so skip the parse entirely.
+            payload_hash = hashlib.md5(payload).hexdigest()
+            if incremental and payload_hash == self._load_last_hash():
+                logging.info(f"[FIRMS] CSV payload unchanged since last run; skipping {url}")
+                return
 
-            # Parse CSV to DataFrame
-            df = pd.read_csv(io.StringIO(r.text))
+            # Feed raw bytes to pandas' C parser (no intermediate str copy).
+            df = pd.read_csv(BytesIO(payload), usecols=_CSV_USECOLS, dtype=_CSV_DTYPES)
             if df.empty:
                 logging.info("[FIRMS] No data found in CSV.")
                 return
 
-            alerts = []
+            # acq_time is zero-padded to HHMM so the composite string both
+            # matches the configured "%Y-%m-%d %H%M" format and sorts
+            # lexicographically in time order.
+            df["event_datetime"] = df["acq_date"].astype(str) + " " + df["acq_time"].astype(str).str.zfill(4)
 
-            for _, row in df.iterrows():
-                alert = self.parse_alert(row)
-                alerts.append(alert)
+            latest_ts = None
+            if incremental:
+                # Zero-padded "%Y-%m-%d %H%M" strings compare in time order,
+                # so the newer-than filter is a plain vectorized string
+                # comparison: no datetime parsing at all on this path.
+                last_ts = self._load_last_timestamp()
+                if last_ts:
+                    df = df[df["event_datetime"] > last_ts]
+                if not df.empty:
+                    latest_ts = df["event_datetime"].max()
+
+            if df.empty:
+                logging.info(f"[FIRMS] No new wildfire alerts since last run from {url}")
+                return
+
+            alerts = self.parse_alerts(df)
+
+            if incremental:
+                # Hash-set dedup on firms_id: O(1) membership beats another
+                # timestamp parse and is robust to clock skew in the feed.
+                seen_ids = load_seen_ids(self.seen_path)
+                if seen_ids:
+                    alerts = [a for a in alerts if a["firms_id"] not in seen_ids]
 
             if alerts:
-                full_output_path = Path(self.base_path) / self.output
-                save_json(alerts, full_output_path, unique_key=self.unique_key)
+                self._save_alerts(alerts, incremental)
                 logging.info(f"[FIRMS] Fetched and saved {len(alerts)} wildfire alerts from {url}")
 
                 if incremental:
-                    # Also save (overwrite) an incremental JSON of new alerts
-                    incremental_dir = Path(self.config.get("incremental_output_dir", self.base_path)) / "incremental"
-                    incremental_dir.mkdir(parents=True, exist_ok=True)
-                    # Use the same output filename to overwrite previous incremental file
-                    inc_file = incremental_dir / self.output
-                    save_json(alerts, inc_file)
-                    logging.info(f"[FIRMS] Overwrote incremental alerts file {inc_file.name}")
+                    # Persisted only once the alerts are safely written:
+                    # recording the hash earlier would make the next run's
+                    # unchanged-payload gate skip detections that never
+                    # reached disk.
+                    self._save_last_hash(payload_hash)
+                    if latest_ts is not None:
+                        self._save_last_timestamp(latest_ts)
+
+                    append_seen_ids(self.seen_path, [a["firms_id"] for a in alerts])
             else:
                 logging.info(f"[FIRMS] No wildfire alerts to save from {url}")
 
         except Exception as e:
             logging.error(f"[FIRMS] Error fetching from {url} | Exception: {e}")
 
+    def _load_last_hash(self):
+        """Return the payload hash stored by the previous run, or None."""
+        return self.state.get("firms.last_hash")
+
+    def _save_last_hash(self, payload_hash):
+        """Persist the payload hash for the next run's change-detection gate."""
+        self.state.set("firms.last_hash", payload_hash)
+
+    def _load_last_timestamp(self):
+        """Return the timestamp string stored by the previous run, or None.
+
+        Kept as a "%Y-%m-%d %H%M" string: with zero-padded times that format
+        is lexicographically monotonic, so callers compare it directly.
+        """
+        ts_str = self.state.get("firms.last_timestamp")
+        if ts_str is None:
+            # Migration path: fall back to the legacy per-source text file.
+            try:
+                if self.ts_path.exists():
+                    ts_str = self.ts_path.read_text().strip()
+            except Exception as e:
+                logging.warning(f"[FIRMS] Could not read last timestamp: {e}")
+        return ts_str or None
+
+    def _save_last_timestamp(self, latest_ts):
+        """Persist the most recent alert timestamp string for the next incremental run."""
+        self.state.set("firms.last_timestamp", latest_ts)
+
     @staticmethod
-    def parse_alert(row):
+    def parse_alerts(df):
         """
-        Extract relevant fields from a single FIRMS CSV row.
+        Extract relevant fields from the FIRMS CSV DataFrame in one vectorized pass.
+
+        Column-wise operations replace the previous per-row iterrows() loop,
+        which materialized a Series object per row.
 
         Args:
-            row (pd.Series): DataFrame row with alert fields.
+            df (pd.DataFrame): DataFrame with the raw FIRMS CSV rows.
 
         Returns:
-            dict: Parsed alert fields.
+            list: Parsed alert dicts.
         """
-        acq_date = str(row.get('acq_date', ''))
-        acq_time = str(row.get('acq_time', ''))
-        event_datetime = f"{acq_date} {acq_time}"
-        alert = {
-            "event_datetime": event_datetime,
-            "latitude": row.get("latitude"),
-            "longitude": row.get("longitude"),
-            "brightness": row.get("brightness"),
-            "confidence": row.get("confidence"),
-            "satellite": row.get("satellite"),
-            "instrument": row.get("instrument"),
-            "daynight": row.get("daynight"),
-            "frp": row.get("frp"),
-            "alert_type": "wildfire"
-        }
+        df = df.copy()
+        if "event_datetime" not in df.columns:
+            df["event_datetime"] = df["acq_date"].astype(str) + " " + df["acq_time"].astype(str).str.zfill(4)
+        df["alert_type"] = "wildfire"
         # Añade el campo único
-        alert["firms_id"] = FIRMSFetcher.generate_firms_id(row)
-        return alert
-    
+        df["firms_id"] = FIRMSFetcher.generate_firms_ids(df)
+        cols = [
+            "event_datetime", "latitude", "longitude", "brightness", "confidence",
+            "satellite", "instrument", "daynight", "frp", "alert_type", "firms_id",
+        ]
+        return df.reindex(columns=cols).to_dict(orient="records")
+
+
     @staticmethod
-    def generate_firms_id(row):
-        """Generate a unique ID for FIRMS alerts using key fields."""
+    def generate_firms_ids(df):
+        """Generate unique IDs for all FIRMS alerts in one vectorized pass.
+
+        The key string (latitude_longitude_acq_date_acq_time) is built with
+        column-wise concatenation so only the md5 digest itself runs per row,
+        keeping ids identical to the previous per-row implementation.
+        """
         # Use latitude, longitude, acq_date, acq_time as unique key
-        key_str = f"{row.get('latitude','')}_{row.get('longitude','')}_{row.get('acq_date','')}_{row.get('acq_time','')}"
-        return hashlib.md5(key_str.encode()).hexdigest()
\ No newline at end of file
+        key_str = (
+            df["latitude"].astype(str) + "_" + df["longitude"].astype(str)
+            + "_" + df["acq_date"].astype(str) + "_" + df["acq_time"].astype(str)
+        )
+        return key_str.map(lambda s: hashlib.md5(s.encode()).hexdigest())
\ No newline at end of file
@@ -12,34 +12,33 @@ It performs the following tasks:
 Intended to be called from a main controller script managing multiple data sources.
 """
 import os
-import requests
 import logging
-import xml.etree.ElementTree as ET
+from lxml import etree as ET
 import re
 from pathlib import Path
 from datetime import datetime
-from utils import save_json
-from config import get_source_config, get_timestamp_format
+import hashlib
+from http_session import get_session
+from fetchers.base_fetcher import BaseFetcher
+from utils import load_seen_ids, append_seen_ids
 
-class GDACSFetcher:
+# Compiled once at import; checked against up to three candidate strings per item.
+_MAG_RE = re.compile(r"Magnitude\s+([0-9.]+)")
+
+# GDACS namespace in Clark notation: item children are dispatched through a
+# dict keyed on child.tag, so the namespaced tags are spelled out once here.
+_GDACS = "{http://www.gdacs.org/}"
+
+class GDACSFetcher(BaseFetcher):
     """Fetcher class to retrieve GDACS alerts and store them locally."""
 
-    def __init__(self, config=None, source_key="gdacs"):
-        """Initialize GDACSFetcher with configuration.
-            
-            Args:
-                config (dict): Optional global config dictionary. If None, it will use get_source_config.
-                source_key (str): Key identifying the source in config.
-        """
-        # Allow passing a preloaded config or fallback to get_source_config
-        self.source_key = source_key
-        self.config = config[source_key] if config and source_key in config else get_source_config(source_key)
-        self.url = self.config["url"]
-        self.base_path = self.config["base_data_path"] 
-        self.output = self.config["output_filename"]
-        self.timestamp_format = get_timestamp_format(source_key)
-        self.unique_key = self.config.get("unique_key")
+    source_key = "gdacs"
+    log_tag = "[GDACS]"
 
+    def __init__(self, config=None, source_key=None):
+        """Initialize GDACSFetcher and derive its seen-ids path once."""
+        super().__init__(config, source_key)
+        self.seen_path = Path(self.base_path) / f"{self.source_key}_seen_ids.txt"
 
     def fetch(self, incremental: bool = True):
         """
@@ -47,45 +46,78 @@ class GDACSFetcher:
         and saves them as JSON. Deduplication is handled by save_json via unique_key.
         """
         try:
-            r = requests.get(self.url, timeout=10)
+            r = get_session().get(self.url, stream=True, timeout=10)
             status_code = r.status_code
             r.raise_for_status()
-
-            # Parse XML response
-            root = ET.fromstring(r.content)
-            items = root.findall(".//item")
+            # Feed the raw socket straight into iterparse so parsing overlaps
+            # with the download instead of waiting for the full body.
+            r.raw.decode_content = True
+
+            # Hash-set dedup: ids seen on previous runs are skipped with an
+            # O(1) membership test instead of relying on timestamp compares.
+            seen_ids = load_seen_ids(self.seen_path) if incremental else set()
+            fresh_ids = []
+
+            # Parse the XML response incrementally: each <item> is handled as
+            # soon as it ends and cleared right after, so memory stays at
+            # O(item) instead of O(feed).
             new_alerts = []
 
-            for item in items:
+            # remove_blank_text drops whitespace-only text nodes between
+            # elements and collect_ids skips the XML-ID dict neither feed uses.
+            for _, item in ET.iterparse(r.raw, events=("end",), tag="item",
+                                        remove_blank_text=True, collect_ids=False):
                 try:
+                    # One pass over the children builds a tag->element dict;
+                    # every field lookup after this is O(1) instead of a
+                    # linear find() walk per tag (and title/description were
+                    # even found twice before).
+                    kids = {}
+                    for child in item:
+                        if child.tag not in kids:
+                            kids[child.tag] = child
+
+                    def child_text(tag):
+                        elem = kids.get(tag)
+                        text = elem.text if elem is not None else None
+                        if not text:
+                            return None
+                        # Strip only when there is edge whitespace; most feed
+                        # fields are clean, so this skips a copy per field.
+                        if text[0].isspace() or text[-1].isspace():
+                            text = text.strip()
+                        return text
+
                     # Extract main fields
-                    title = item.find("title").text.strip() if item.find("title") is not None else ""
-                    description = item.find("description").text.strip() if item.find("description") is not None else ""
+                    title = child_text("title") or ""
+                    description = child_text("description") or ""
 
                     # Extract event datetime (prefer gdacs:fromdate, fallback to pubDate)
-                    event_dt_elem = item.find("{http://www.gdacs.org/}fromdate")
-                    event_datetime = event_dt_elem.text.strip() if event_dt_elem is not None else None
-                    if not event_datetime:
-                        pubdate_elem = item.find("pubDate")
-                        event_datetime = pubdate_elem.text.strip() if pubdate_elem is not None else None
+                    event_datetime = child_text(f"{_GDACS}fromdate") or child_text("pubDate")
 
-                    # Extract magnitude from <gdacs:severity> or from text if not present
+                    # Extract magnitude from <gdacs:severity>, falling back to
+                    # title then description. Scanning the candidates in turn
+                    # stops at the first hit and avoids concatenating
+                    # title + description into a throwaway string per item.
                     mag = None
-                    sev_elem = item.find("{http://www.gdacs.org/}severity")
-                    if sev_elem is not None and sev_elem.text:
-                        mag_match = re.search(r"Magnitude\s+([0-9.]+)", sev_elem.text)
-                        if mag_match:
-                            mag = float(mag_match.group(1))
-                    if mag is None:
-                        mag_match = re.search(r"Magnitude\s+([0-9.]+)", title + " " + description)
-                        mag = float(mag_match.group(1)) if mag_match else None
+                    for haystack in (child_text(f"{_GDACS}severity"), title, description):
+                        if haystack:
+                            mag_match = _MAG_RE.search(haystack)
+                            if mag_match:
+                                mag = float(mag_match.group(1))
+                                break
 
                     # Extract country and alert level
-                    country_elem = item.find("{http://www.gdacs.org/}country")
-                    country = country_elem.text.strip() if country_elem is not None else None
+                    country = child_text(f"{_GDACS}country")
+                    alertlevel = child_text(f"{_GDACS}alertlevel")
 
-                    alertlevel_elem = item.find("{http://www.gdacs.org/}alertlevel")
-                    alertlevel = alertlevel_elem.text.strip() if alertlevel_elem is not None else None
+                    if incremental:
+                        alert_id = hashlib.md5(
+                            f"{title}_{event_datetime}_{country}".encode()).hexdigest()
+                        if alert_id in seen_ids:
+                            continue
+                        seen_ids.add(alert_id)
+                        fresh_ids.append(alert_id)
 
                     alert = {
                         "title": title,
@@ -96,23 +128,22 @@ class GDACSFetcher:
                         "alertlevel": alertlevel
                     }
                     new_alerts.append(alert)
-                except Exception as e:
+                except (AttributeError, ValueError, TypeError) as e:
                     logging.warning(f"[GDACS] Skipping malformed alert: {e}")
+                finally:
+                    # lxml idiom: free the item and any already-processed
+                    # siblings still referenced by the partial tree.
+                    item.clear()
+                    while item.getprevious() is not None:
+                        del item.getparent()[0]
 
             # Save all alerts (deduplication by unique_key in save_json)
             if new_alerts:
-                full_output_path = Path(self.base_path) / self.output
-                save_json(new_alerts, full_output_path, unique_key=self.unique_key)
+                self._save_alerts(new_alerts, incremental)
                 logging.info(f"[GDACS] Fetched {len(new_alerts)} alerts from {self.url} | Status: {status_code}")
 
                 if incremental:
-                    # Also save (overwrite) an incremental JSON of new alerts
-                    incremental_dir = Path(self.config.get("incremental_output_dir", self.base_path)) / "incremental"
-                    incremental_dir.mkdir(parents=True, exist_ok=True)
-                    # Use the same output filename to overwrite previous incremental file
-                    inc_file = incremental_dir / self.output
-                    save_json(new_alerts, inc_file)
-                    logging.info(f"[GDACS] Overwrote incremental alerts file {inc_file.name}")
+                    append_seen_ids(self.seen_path, fresh_ids)
             else:
                 logging.info(f"[GDACS] No new alerts to save from {self.url}")
 
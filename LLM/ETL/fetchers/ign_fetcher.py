@@ -10,34 +10,27 @@ It performs the following tasks:
 
 Intended to be called from a main controller script managing multiple data sources.
 """
-import os
-import requests
+from http_session import get_session
 import logging
 import re
-from pathlib import Path
 from datetime import datetime
-import xml.etree.ElementTree as ET
-from utils import save_json
-from config import get_source_config, get_timestamp_format
+from lxml import etree as ET
+from fetchers.base_fetcher import BaseFetcher
 
-class IGNFetcher:
+# Compiled once at import. The three fields sit in a fixed order in IGN's
+# description text, so one pattern with named groups extracts them in a
+# single scan instead of three separate searches per item.
+_DESC_RE = re.compile(
+    r"magnitud (?P<magnitude>\d+(?:\.\d+)?)"
+    r".*?en (?P<location>.*?) en la fecha (?P<fecha>[\d/ :]+) en la siguiente",
+    re.DOTALL,
+)
+
+class IGNFetcher(BaseFetcher):
     """Fetcher class to retrieve IGN seismic alerts and store them locally."""
 
-    def __init__(self, config=None, source_key="ign"):
-        """Initialize IGNFetcher with configuration.
-            
-            Args:
-                config (dict): Optional global config dictionary. If None, it will use get_source_config.
-                source_key (str): Key identifying the source in config.
-        """
-        # Allow passing a preloaded config or fallback to get_source_config
-        self.source_key = source_key
-        self.config = config[source_key] if config and source_key in config else get_source_config(source_key)
-        self.url = self.config["url"]
-        self.base_path = self.config["base_data_path"] 
-        self.output = self.config["output_filename"]
-        self.timestamp_format = get_timestamp_format(source_key)
-        self.unique_key = self.config.get("unique_key")
+    source_key = "ign"
+    log_tag = "[IGN]"
 
     def fetch(self, incremental: bool = True):
         """
@@ -50,26 +43,37 @@ class IGNFetcher:
         """
 
         try:
-            response = requests.get(self.url, timeout=10)
+            response = get_session().get(self.url, stream=True, timeout=10)
             response.raise_for_status()
-            root = ET.fromstring(response.content)
-
-            channel = root.find("channel")
-            items = channel.findall("item") if channel is not None else []
+            # Stream the feed straight into iterparse: items are processed as
+            # their end tags arrive and freed right after, so memory stays
+            # bounded regardless of feed size.
+            response.raw.decode_content = True
 
             alerts = []
-            for item in items:
+            for _, item in ET.iterparse(response.raw, events=("end",), tag="item",
+                                        remove_blank_text=True, collect_ids=False):
                 try:
-                    title = item.find("title").text.strip()
-                    description = item.find("description").text.strip()
+                    title_elem = item.find("title")
+                    desc_elem = item.find("description")
+                    # Guard instead of raising: an item without these two
+                    # text fields carries nothing worth storing, and the
+                    # guard skips the exception machinery on malformed feeds.
+                    if (title_elem is None or title_elem.text is None
+                            or desc_elem is None or desc_elem.text is None):
+                        logging.warning("[IGN] Skipping alert element without title/description")
+                        continue
+                    title = title_elem.text.strip()
+                    description = desc_elem.text.strip()
 
                     # Parse description for magnitude, location, datetime
-                    mag_match = re.search(r"magnitud (\d+(?:\.\d+)?)", description)
-                    loc_match = re.search(r"en (.*?) en la fecha", description)
-                    fecha_match = re.search(r"fecha ([\d/ :]+) en la siguiente", description)
-                    magnitude = float(mag_match.group(1)) if mag_match else None
-                    location = loc_match.group(1) if loc_match else None
-                    event_datetime = fecha_match.group(1) if fecha_match else None
+                    desc_match = _DESC_RE.search(description)
+                    if desc_match:
+                        magnitude = float(desc_match.group("magnitude"))
+                        location = desc_match.group("location")
+                        event_datetime = desc_match.group("fecha")
+                    else:
+                        magnitude = location = event_datetime = None
 
                     alert = {
                         "title": title,
@@ -79,24 +83,19 @@ class IGNFetcher:
                         "location": location
                     }
                     alerts.append(alert)
-                except Exception as e:
+                except (AttributeError, ValueError, TypeError) as e:
                     logging.warning(f"[IGN] Skipping malformed alert element: {e}")
+                finally:
+                    # lxml idiom: free the item and any already-processed
+                    # siblings still referenced by the partial tree.
+                    item.clear()
+                    while item.getprevious() is not None:
+                        del item.getparent()[0]
 
             # Save all parsed alerts
             if alerts:
-                full_output_path = Path(self.base_path) / self.output
-                save_json(alerts, full_output_path, unique_key=self.unique_key)
+                self._save_alerts(alerts, incremental)
                 logging.info(f"[IGN] Fetched {len(alerts)} alerts from {self.url} | Status: {response.status_code}")
-
-                if incremental:
-                    # Also save (overwrite) an incremental JSON of new alerts
-                    incremental_dir = Path(self.config.get("incremental_output_dir", self.base_path)) / "incremental"
-                    incremental_dir.mkdir(parents=True, exist_ok=True)
-                    # Use the same output filename to overwrite previous incremental file
-                    inc_file = incremental_dir / self.output
-                    save_json(alerts, inc_file)
-                    logging.info(f"[IGN] Overwrote incremental alerts file {inc_file.name}")
-
             else:
                 logging.info(f"[IGN] No alerts found to save from {self.url}")
 
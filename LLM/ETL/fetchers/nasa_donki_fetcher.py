@@ -15,76 +15,69 @@ Intended for use in a modular ETL pipeline.
 import logging
 import re
 from datetime import datetime
-from pathlib import Path
-from config import get_source_config, get_timestamp_format
-from utils import save_json
-import requests
-
-class NASADONKIFetcher:
+from fetchers.base_fetcher import BaseFetcher
+from http_session import get_session
+import orjson
+
+# Compiled once; each costs one linear scan over the multi-KB message body.
+_TYPE_RE = re.compile(r"Radiation Belt Enhancement|CME|Solar Flare")
+_TYPE_MAP = {
+    "Radiation Belt Enhancement": "Radiation Belt Enhancement",
+    "CME": "Coronal Mass Ejection",
+    "Solar Flare": "Solar Flare",
+}
+_SUM_RE = re.compile(r"^.*(?:Summary|Significantly elevated).*$", re.M)
+
+class NASADONKIFetcher(BaseFetcher):
     """Fetcher class to retrieve NASA DONKI space weather alerts and save them locally."""
 
-    def __init__(self, config=None, source_key="nasa_donki"):
-        """Initialize NASADONKIFetcher with configuration.
-            
-            Args:
-                config (dict): Optional global config dictionary. If None, it will use get_source_config.
-                source_key (str): Key identifying the source in config.
-        """
-        # Allow passing a preloaded config or fallback to get_source_config
-        self.source_key = source_key
-        self.config = config[source_key] if config and source_key in config else get_source_config(source_key)
-        self.url = self.config["url"]
-        self.base_path = self.config["base_data_path"] 
-        self.output = self.config["output_filename"]
-        self.timestamp_format = get_timestamp_format(source_key)
-        self.unique_key = self.config.get("unique_key")
+    source_key = "nasa_donki"
+    log_tag = "[DONKI]"
 
     def fetch(self, incremental: bool = True):
         """Fetch NOAA alerts from the configured URL, parse message fields, and save to a JSON file."""
         try:
-            r = requests.get(self.url, timeout=10)
+            r = get_session().get(self.url, timeout=(3.05, 10), headers={"Accept": "application/json"})
             status_code = r.status_code
             r.raise_for_status()
-            data = r.json()
+            # DONKI bodies reach several MB in active periods; orjson decodes
+            # the raw bytes directly, skipping requests' charset detection.
+            data = orjson.loads(r.content)
 
-            # Parse all alerts
+            # Parse all alerts, with per-iteration attribute lookups hoisted
+            # to locals and the body fetched once per alert.
             parsed_alerts = []
+            parse_message = self.parse_message
+            append = parsed_alerts.append
             for alert in data:
-                parsed = self.parse_message(alert.get("messageBody", ""))
+                get = alert.get
+                body = get("messageBody", "")
+                parsed = parse_message(body)
                 enriched_alert = {
-                    "message_id": alert.get("messageID", ""),
-                    "issue_datetime": alert.get("messageIssueTime", ""),
-                    "body": alert.get("messageBody", ""),
-                    "url": alert.get("messageURL", ""),
+                    "message_id": get("messageID", ""),
+                    "issue_datetime": get("messageIssueTime", ""),
+                    "body": body,
+                    "url": get("messageURL", ""),
                     # Enriched fields:
                     "alert_type": parsed["alert_type"],
                     "event_summary": parsed["event_summary"],
                 }
-                parsed_alerts.append(enriched_alert)
+                append(enriched_alert)
 
             if parsed_alerts:
-                full_output_path = Path(self.base_path) / self.output
-                save_json(parsed_alerts, full_output_path, unique_key=self.unique_key)
+                self._save_alerts(parsed_alerts, incremental)
                 logging.info(
-                    f"[DONKI] Fetched {len(parsed_alerts)} alerts from {self.url} | Status: {status_code}"
+                    "[DONKI] Fetched %d alerts from %s | Status: %s",
+                    len(parsed_alerts), self.url, status_code,
                 )
-
-                if incremental:
-                    # Also save (overwrite) an incremental JSON of new alerts
-                    incremental_dir = Path(self.config.get("incremental_output_dir", self.base_path)) / "incremental"
-                    incremental_dir.mkdir(parents=True, exist_ok=True)
-                    # Use the same output filename to overwrite previous incremental file
-                    inc_file = incremental_dir / self.output
-                    save_json(parsed_alerts, inc_file)
-                    logging.info(f"[DONKI] Overwrote incremental alerts file {inc_file.name}")
-
             else:
-                logging.info(f"[DONKI] No alerts to save from {self.url}")
+                logging.info("[DONKI] No alerts to save from %s", self.url)
 
         except Exception as e:
             status = getattr(e.response, 'status_code', 'N/A') if hasattr(e, 'response') else 'N/A'
             logging.error(
-                f"[DONKI] Error fetching from {self.url} | Status: {status} | Exception: {e}"
+                "[DONKI] Error fetching from %s | Status: %s | Exception: %s",
+                self.url, status, e,
             )
 
     @staticmethod
@@ -98,25 +91,16 @@ class NASADONKIFetcher:
         Returns:
             dict: Parsed fields (alert_type, event_summary, etc.)
         """
-        # Example parsing (you can expand this as needed):
-        alert_type = None
-        event_summary = None
-
-        # Find type in the message body (very basic, adjust as needed)
-        if "Radiation Belt Enhancement" in message:
-            alert_type = "Radiation Belt Enhancement"
-        elif "CME" in message:
-            alert_type = "Coronal Mass Ejection"
-        elif "Solar Flare" in message:
-            alert_type = "Solar Flare"
-
-        # For summary, grab first few lines or a summary section
-        summary_lines = message.strip().split("\n")
-        event_summary = ""
-        for line in summary_lines:
-            if "Summary" in line or "Significantly elevated" in line:
-                event_summary = line.strip()
-                break
+        # One alternation scan instead of a full-body pass per keyword; the
+        # earliest mention wins, which in DONKI bodies is the header line
+        # naming the message type.
+        type_match = _TYPE_RE.search(message)
+        alert_type = _TYPE_MAP[type_match.group(0)] if type_match else None
+
+        # First line mentioning Summary / Significantly elevated, found
+        # without splitting the whole body into a list of lines.
+        sum_match = _SUM_RE.search(message)
+        event_summary = sum_match.group(0).strip() if sum_match else ""
 
         return {
             "alert_type": alert_type,
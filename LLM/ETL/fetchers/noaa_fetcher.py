@@ -16,49 +16,54 @@ Intended to be called from a main controller script managing multiple data sourc
 import logging
 import re
 from datetime import datetime
-from pathlib import Path
-from config import get_source_config, get_timestamp_format
-from utils import save_json
-import requests
-
-class NOAAFetcher:
+from fetchers.base_fetcher import BaseFetcher
+from http_session import get_session
+import orjson
+
+# All message fields fused into one compiled alternation: a single
+# finditer pass walks each multi-KB body once and m.lastgroup says which
+# field matched, instead of five separate full scans per alert.
+_RE_NOAA = re.compile(
+    r"(?P<type>ALERT|WARNING)"
+    r"|K-index of (?P<k>\d+)"
+    r"|Valid From:[ \t]*(?P<vfrom>[^\r\n]+)"
+    r"|Valid To:[ \t]*(?P<vto>[^\r\n]+)"
+    r"|Potential Impacts:(?P<impacts>.+)",
+    re.DOTALL,
+)
+_RE_WS = re.compile(r"\s+")
+
+class NOAAFetcher(BaseFetcher):
     """Fetcher class to retrieve NOAA space weather alerts and save them locally."""
 
-    def __init__(self, config=None, source_key="noaa_swpc"):
-        """Initialize NOAAFetcher with configuration.
-            
-            Args:
-                config (dict): Optional global config dictionary. If None, it will use get_source_config.
-                source_key (str): Key identifying the source in config.
-        """
-        # Allow passing a preloaded config or fallback to get_source_config
-        self.source_key = source_key
-        self.config = config[source_key] if config and source_key in config else get_source_config(source_key)
-        self.url = self.config["url"]
-        self.base_path = self.config["base_data_path"] 
-        self.output = self.config["output_filename"]
-        self.timestamp_format = get_timestamp_format(source_key)
-        self.unique_key = self.config.get("unique_key")
-
+    source_key = "noaa_swpc"
+    log_tag = "[NOAA]"
 
     def fetch(self, incremental: bool = True):
         """Fetch NOAA alerts from the configured URL, parse message fields, and save to a JSON file."""
         try:
-            r = requests.get(self.url, timeout=10)
+            r = get_session().get(self.url, timeout=(3.05, 10))
             status_code = r.status_code
             r.raise_for_status()
-            data = r.json()
+            # orjson decodes the raw bytes directly, skipping requests'
+            # charset detection and the stdlib parser.
+            data = orjson.loads(r.content)
 
-            # Parse and enrich alerts
+            # Parse and enrich alerts. Method/bound lookups are hoisted out
+            # of the loop: LOAD_ATTR on self and the list costs per iteration
+            # otherwise.
             new_alerts = []
+            parse_message = self.parse_message
+            append = new_alerts.append
             for alert in data:
                 try:
                     # Parse the message field and enrich the alert
-                    parsed = self.parse_message(alert["message"])
+                    get = alert.get
+                    parsed = parse_message(alert["message"])
                     enriched_alert = {
-                        "product_id": alert.get("product_id", ""),
-                        "issue_datetime": alert.get("issue_datetime", ""),
-                        "message": alert.get("message", ""),
+                        "product_id": get("product_id", ""),
+                        "issue_datetime": get("issue_datetime", ""),
+                        "message": get("message", ""),
                         # Enriched fields:
                         "alert_type": parsed["alert_type"],
                         "k_index": parsed["k_index"],
@@ -66,33 +71,24 @@ class NOAAFetcher:
                         "valid_to": parsed["valid_to"],
                         "impacts": parsed["impacts"],
                     }
-                    new_alerts.append(enriched_alert)
+                    append(enriched_alert)
                 except Exception as e:
-                    logging.warning(f"[NOAA] Skipping alert with invalid timestamp: {e}")
+                    logging.warning("[NOAA] Skipping alert with invalid timestamp: %s", e)
 
             if new_alerts:
-                full_output_path = Path(self.base_path) / self.output
-                save_json(new_alerts, full_output_path, unique_key=self.unique_key)
+                self._save_alerts(new_alerts, incremental)
                 logging.info(
-                    f"[NOAA] Fetched {len(new_alerts)} alerts from {self.url} | Status: {status_code}"
+                    "[NOAA] Fetched %d alerts from %s | Status: %s",
+                    len(new_alerts), self.url, status_code,
                 )
-
-                if incremental:
-                    # Also save (overwrite) an incremental JSON of new alerts
-                    incremental_dir = Path(self.config.get("incremental_output_dir", self.base_path)) / "incremental"
-                    incremental_dir.mkdir(parents=True, exist_ok=True)
-                    # Use the same output filename to overwrite previous incremental file
-                    inc_file = incremental_dir / self.output
-                    save_json(new_alerts, inc_file)
-                    logging.info(f"[NOAA] Overwrote incremental alerts file {inc_file.name}")
-
             else:
-                logging.info(f"[NOAA] No alerts to save from {self.url}")
+                logging.info("[NOAA] No alerts to save from %s", self.url)
 
         except Exception as e:
             status = getattr(e.response, 'status_code', 'N/A') if hasattr(e, 'response') else 'N/A'
             logging.error(
-                f"[NOAA] Error fetching from {self.url} | Status: {status} | Exception: {e}"
+                "[NOAA] Error fetching from %s | Status: %s | Exception: %s",
+                self.url, status, e,
             )
 
     @staticmethod
@@ -112,29 +108,29 @@ class NOAAFetcher:
         k_index = None
         impacts = None
 
-        # Type of alert (ALERT, WARNING, etc.)
-        if "ALERT" in message:
-            alert_type = "ALERT"
-        elif "WARNING" in message:
-            alert_type = "WARNING"
-
-        # Geomagnetic K-index
-        k_match = re.search(r"K-index of (\d+)", message)
-        if k_match:
-            k_index = k_match.group(1)
-
-        # Validity period
-        from_match = re.search(r"Valid From:\s*([^\r\n]+)", message)
-        if from_match:
-            valid_from = from_match.group(1).strip()
-        to_match = re.search(r"Valid To:\s*([^\r\n]+)", message)
-        if to_match:
-            valid_to = to_match.group(1).strip()
-
-        # Potential Impacts
-        impacts_match = re.search(r"Potential Impacts:(.+)", message, re.DOTALL)
-        if impacts_match:
-            impacts = impacts_match.group(1).strip().replace("\r\n", " ").replace("\n", " ")
+        # One pass over the body; the first hit per field wins, matching the
+        # old per-field re.search semantics. The impacts group consumes the
+        # rest of the message, which is also where NOAA puts it.
+        for m in _RE_NOAA.finditer(message):
+            group = m.lastgroup
+            if group == "type" and alert_type != "ALERT":
+                # ALERT outranks WARNING wherever it appears, matching the
+                # old if "ALERT"/elif "WARNING" substring checks; a WARNING
+                # hit is only provisional until the scan ends.
+                if m.group("type") == "ALERT":
+                    alert_type = "ALERT"
+                elif alert_type is None:
+                    alert_type = "WARNING"
+            elif group == "k" and k_index is None:
+                k_index = m.group("k")
+            elif group == "vfrom" and valid_from is None:
+                valid_from = m.group("vfrom").strip()
+            elif group == "vto" and valid_to is None:
+                valid_to = m.group("vto").strip()
+            elif group == "impacts" and impacts is None:
+                # Single substitution pass instead of strip + two replace
+                # walks; also collapses internal whitespace runs.
+                impacts = _RE_WS.sub(" ", m.group("impacts")).strip()
 
         return {
             "alert_type": alert_type,
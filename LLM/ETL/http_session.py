@@ -0,0 +1,35 @@
+# http_session.py – Shared HTTP session for all fetchers
+
+"""
+Module-level `requests.Session` shared by every fetcher.
+
+Reusing one session enables HTTP keep-alive and connection pooling, so
+repeated requests to the same host (and AEMET's two sequential GETs) skip
+the TCP + TLS handshake that otherwise dominates latency on HTTPS calls.
+
+The adapter also retries transient failures (429/5xx, network blips) with
+exponential backoff on the already-warm connection, so a blip no longer
+costs a whole fetch cycle.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+_retry = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET"],
+)
+
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=_retry)
+
+_SESSION = requests.Session()
+_SESSION.mount("http://", _adapter)
+_SESSION.mount("https://", _adapter)
+
+
+def get_session():
+    """Return the shared requests.Session used by all fetchers."""
+    return _SESSION
@@ -1,5 +1,6 @@
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from fetchers.noaa_fetcher import NOAAFetcher
 from fetchers.usgs_earthquake_fetcher import USGSEarthquakeFetcher
 from fetchers.nasa_donki_fetcher import NASADONKIFetcher
@@ -9,6 +10,53 @@ from fetchers.ign_fetcher import IGNFetcher
 from fetchers.firms_fetcher import FIRMSFetcher
 from config import CONFIG, get_incremental_flag
 
+# Static source -> fetcher mapping and the enabled-source list, both built
+# once at import: CONFIG is already parsed at import time and neither
+# changes within a run, so per-call reconstruction bought nothing.
+FETCHERS = {
+    "noaa_swpc": NOAAFetcher,
+    "nasa_donki": NASADONKIFetcher,
+    "usgs_earthquakes": USGSEarthquakeFetcher,
+    "aemet": AEMETFetcher,
+    "gdacs": GDACSFetcher,
+    "ign": IGNFetcher,
+    "firms": FIRMSFetcher,
+}
+
+ENABLED_SOURCES = tuple(
+    source for source, cfg in CONFIG.items()
+    if isinstance(cfg, dict) and cfg.get("enabled", False)
+)
+
+
+def run_all(fetchers, max_workers=None):
+    """
+    Run the given (source_key, fetcher) pairs concurrently.
+
+    Each fetch is network-bound and independent, so a thread pool lets the
+    downloads overlap and total wall time drops to roughly the slowest
+    source instead of the sum of all of them. The shared requests.Session
+    is thread-safe for plain GETs, and every fetcher prefixes its log lines
+    with a source tag so interleaved output stays readable.
+    """
+    if not fetchers:
+        return
+    with ThreadPoolExecutor(max_workers=max_workers or len(fetchers)) as executor:
+        futures = {
+            executor.submit(fetcher.fetch, incremental=get_incremental_flag(source)): source
+            for source, fetcher in fetchers
+        }
+        # Report each source as it finishes; fetch() swallows its own
+        # network errors, so anything raising here is a real bug.
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                future.result()
+                logging.info("Finished fetch for %s", source)
+            except Exception as e:
+                logging.error("Fetcher for %s raised: %s", source, e)
+
+
 def run_all_sources():
     # Configure logging
     log_dir = os.path.join(os.path.dirname(__file__), '..', 'logs')
@@ -22,29 +70,23 @@ def run_all_sources():
         datefmt='%Y-%m-%d %H:%M:%S'
     )
 
-    enabled_sources = [
-        source for source, cfg in CONFIG.items()
-        if isinstance(cfg, dict) and cfg.get("enabled", False)
-    ]
-    logging.info(f"Enabled sources for this run: {', '.join(enabled_sources) if enabled_sources else 'None'}")
+    logging.info(f"Enabled sources for this run: {', '.join(ENABLED_SOURCES) if ENABLED_SOURCES else 'None'}")
 
-    for source in enabled_sources:
+    fetchers = []
+    for source in ENABLED_SOURCES:
+        fetcher_class = FETCHERS.get(source)
+        if fetcher_class is None:
+            # Config can enable sources with no registered fetcher (e.g. a
+            # retired meteoalarm block); skip them instead of aborting the
+            # whole run on a KeyError.
+            logging.warning("No fetcher registered for enabled source %s; skipping", source)
+            continue
         logging.info(f"Downloading data from {source.upper()} (incremental={get_incremental_flag(source)})")
-        
-        if source == "noaa_swpc":
-            NOAAFetcher().fetch(incremental=get_incremental_flag(source))
-        elif source == "nasa_donki":
-            NASADONKIFetcher().fetch(incremental=get_incremental_flag(source))
-        elif source == "usgs_earthquakes":
-            USGSEarthquakeFetcher().fetch(incremental=get_incremental_flag(source))
-        elif source == "aemet":
-            AEMETFetcher().fetch(incremental=get_incremental_flag(source))
-        elif source == "gdacs":
-            GDACSFetcher().fetch(incremental=get_incremental_flag(source))
-        elif source == "ign":
-            IGNFetcher().fetch(incremental=get_incremental_flag(source))
-        elif source == "firms":
-            FIRMSFetcher().fetch(incremental=get_incremental_flag(source))
+        # Hand every fetcher the already-parsed CONFIG dict; the per-source
+        # lookup then happens in-process with no config re-read anywhere.
+        fetchers.append((source, fetcher_class(config=CONFIG)))
+
+    run_all(fetchers)
 
 if __name__ == "__main__":
     run_all_sources()
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""
+state.py
+
+Single JSON state file shared by the fetchers for small per-source values
+(last timestamps, payload hashes). Each fetcher previously kept its own
+text file, paying an exists+read at the start of every fetch and a
+mkdir+write at the end; the store loads the file once per controller run,
+keeps changes in memory, and flushes them in one write at exit.
+"""
+
+import atexit
+import logging
+import os
+from pathlib import Path
+
+import orjson
+
+
+class StateStore:
+    """In-memory key-value state backed by one JSON file, flushed once."""
+
+    def __init__(self, file_path):
+        """
+        Args:
+            file_path: Path of the JSON state file.
+        """
+        self.file_path = Path(file_path)
+        self._state = None
+        self._dirty = False
+        self._loaded_mtime = None
+
+    def _load(self):
+        """Return the in-memory state, reading the file only when needed.
+
+        The cached dict is reused across fetches in a long-lived controller;
+        a changed file mtime (external edit) invalidates it, unless there are
+        unflushed local changes, which always win.
+        """
+        try:
+            mtime = self.file_path.stat().st_mtime
+        except OSError:
+            mtime = None
+        if self._state is not None and (self._dirty or mtime == self._loaded_mtime):
+            return self._state
+        try:
+            self._state = orjson.loads(self.file_path.read_bytes()) if mtime is not None else {}
+        except Exception as e:
+            logging.warning(f"[state] Could not read state file {self.file_path}: {e}")
+            self._state = {}
+        self._loaded_mtime = mtime
+        return self._state
+
+    def get(self, key, default=None):
+        """Return the stored value for key, or default."""
+        return self._load().get(key, default)
+
+    def set(self, key, value):
+        """Store value for key in memory; it reaches disk on the next flush."""
+        self._load()[key] = value
+        self._dirty = True
+
+    def flush(self):
+        """Write pending changes to disk. No-op when nothing changed."""
+        if not self._dirty:
+            return
+        try:
+            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+            # Same tmp-file + os.replace pattern as save_json: the rename is
+            # atomic, so a crash mid-flush can never truncate the state file
+            # and drop every stored validator and hash at once.
+            tmp_path = f"{self.file_path}.tmp"
+            Path(tmp_path).write_bytes(orjson.dumps(self._state, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_path, self.file_path)
+            self._dirty = False
+            self._loaded_mtime = self.file_path.stat().st_mtime
+        except Exception as e:
+            logging.warning(f"[state] Could not write state file {self.file_path}: {e}")
+
+
+# One store per base data directory, flushed automatically at interpreter exit.
+_STORES = {}
+
+
+def get_state(base_path):
+    """Return the shared StateStore for a base data directory."""
+    key = str(base_path)
+    if key not in _STORES:
+        store = StateStore(Path(base_path) / "state.json")
+        atexit.register(store.flush)
+        _STORES[key] = store
+    return _STORES[key]
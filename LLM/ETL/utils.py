@@ -1,7 +1,8 @@
 # utils.py – Common utilities for alert processing
 
 import os
-import json
+import orjson
+from pathlib import Path
 from datetime import datetime
 import logging
 
@@ -41,11 +42,12 @@ def save_json(data, file_path, unique_key=None):
 
     existing = []
     if os.path.exists(file_path):
-        with open(file_path, "r", encoding="utf-8") as f:
-            try:
-                existing = json.load(f)
-            except Exception:
-                existing = []
+        try:
+            # One read syscall into bytes, decoded by orjson in C; skips the
+            # BufferedReader setup and the stdlib per-token decoding.
+            existing = orjson.loads(Path(file_path).read_bytes())
+        except Exception:
+            existing = []
 
     if unique_key:
         all_alerts = {a[unique_key]: a for a in existing if unique_key in a}
@@ -58,7 +60,60 @@ def save_json(data, file_path, unique_key=None):
     else:
         final = existing + data
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(final, f, ensure_ascii=False, indent=2)
+    # orjson serializes in C straight to UTF-8 bytes; OPT_SERIALIZE_NUMPY
+    # lets alert dicts coming out of pandas keep their numpy scalars. The
+    # outputs are machine-consumed, so no pretty-print indentation: compact
+    # JSON roughly halves the bytes written and re-read every merge.
+    # Write to a sibling temp file and os.replace it into place: the rename
+    # is atomic on the same filesystem, so a crash mid-write can never leave
+    # a truncated archive for the next merge (or a preprocessor) to read.
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(orjson.dumps(
+            final,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        ))
+    os.replace(tmp_path, file_path)
     logging.info(f"[utils] Saved to: {file_path}")
-    return file_path
\ No newline at end of file
+    return file_path
+
+
+def load_seen_ids(file_path):
+    """
+    Load the set of alert id hashes seen on previous runs (one per line).
+
+    Membership checks against this set are O(1), so fetchers can drop
+    already-known alerts without re-parsing timestamps or re-reading the
+    full output JSON.
+
+    Args:
+        file_path: Path to the seen-ids text file.
+
+    Returns:
+        set: Previously seen id strings (empty if the file is missing).
+    """
+    try:
+        if os.path.exists(file_path):
+            with open(file_path, "r", encoding="utf-8") as f:
+                return {line.strip() for line in f if line.strip()}
+    except Exception as e:
+        logging.warning(f"[utils] Could not read seen-ids file {file_path}: {e}")
+    return set()
+
+
+def append_seen_ids(file_path, ids):
+    """
+    Append newly seen alert ids to the on-disk set.
+
+    Args:
+        file_path: Path to the seen-ids text file.
+        ids (iterable): New id strings to record.
+    """
+    if not ids:
+        return
+    try:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "a", encoding="utf-8") as f:
+            f.writelines(f"{alert_id}\n" for alert_id in ids)
+    except Exception as e:
+        logging.warning(f"[utils] Could not update seen-ids file {file_path}: {e}")
\ No newline at end of file
@@ -1,4 +1,5 @@
-import json
+import functools
+import orjson
 import pathlib
 
 # Define the root of the project (assume config.py is at RF/LLM/Preprocessing/)
@@ -7,52 +8,78 @@ PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[2]  # This points to RF/
 CONFIG_PATH = pathlib.Path(__file__).parent / "config.json"
 
 def load_config():
-    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # Parsed exactly once at import; orjson decodes the raw bytes in C.
+    return orjson.loads(CONFIG_PATH.read_bytes())
 
 CONFIG = load_config()
 
+# CONFIG never changes after import, so the getters below memoize their
+# lookups and path/string work with lru_cache.
+
 def get_absolute_path(rel_path):
     """
     Given a relative path (from config.json), return its absolute path from project root.
     """
     return PROJECT_ROOT / rel_path
 
+@functools.lru_cache(maxsize=None)
 def get_base_path():
     # Base input path for all alerts (raw source data)
     rel_path = CONFIG.get("base_data_path", "data/alerts")
     return get_absolute_path(rel_path)
 
+@functools.lru_cache(maxsize=None)
 def get_preprocessed_path():
     # Output path for preprocessed data
     rel_path = CONFIG.get("preprocessed_output_path", "data/preprocessed")
     return get_absolute_path(rel_path)
 
+@functools.lru_cache(maxsize=None)
 def get_source_config(source_key):
     # Get config for a specific source
     return CONFIG["sources"].get(source_key, {})
 
+@functools.lru_cache(maxsize=None)
 def get_source_input_path(source_key):
     # Get absolute input path for a given source
     rel_path = CONFIG["sources"][source_key]["input_path_template"]
     return get_absolute_path(rel_path)
 
+@functools.lru_cache(maxsize=None)
 def get_source_output_path(source_key):
     rel_path = CONFIG["sources"][source_key]["output_path_template"]
     return get_absolute_path(rel_path)
 
+@functools.lru_cache(maxsize=None)
 def get_serialization_rules():
     # Return the serialization rules
     return CONFIG.get("serialization_rules", {})
 
+@functools.lru_cache(maxsize=None)
 def get_output_schema():
     # Return the output schema for the target unified JSON
     return CONFIG.get("output_schema", {})
 
+@functools.lru_cache(maxsize=None)
 def get_field_format(field):
     # Get formatting string for a specific field, if defined
     return CONFIG.get("field_formats", {}).get(field, None)
 
+@functools.lru_cache(maxsize=None)
+def get_nlp(model_name):
+    """
+    Load and cache a spaCy model, keeping only the components NER needs.
+
+    The preprocessors read nothing but doc.ents, so parser, tagger,
+    lemmatizer and attribute_ruler are disabled: the model loads faster
+    and each document skips the unused pipeline stages. The cache hands
+    every caller in the run the same instance per model name instead of
+    paying the multi-second load per preprocessor.
+    """
+    import spacy  # deferred: config is also imported by non-NLP preprocessors
+    return spacy.load(model_name, disable=["parser", "tagger", "lemmatizer", "attribute_ruler"])
+
+@functools.lru_cache(maxsize=None)
 def get_incremental_flag(source_key):
     """
     Retrieve the 'incremental' boolean flag from config.json.
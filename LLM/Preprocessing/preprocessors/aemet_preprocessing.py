@@ -1,10 +1,15 @@
-import json
-import spacy
-import os
+import orjson
+import re
 import logging
 from typing import List, Dict
 from pathlib import Path
-from config import get_source_config, get_source_input_path, get_source_output_path, get_serialization_rules, get_output_schema
+from config import get_source_config, get_source_input_path, get_source_output_path, get_serialization_rules, get_output_schema, get_nlp
+from utils import read_json, append_jsonl, append_seen_ids, load_output_keys
+
+# Palabras clave de fenómenos meteorológicos comunes, compiled once as a
+# single alternation; no word boundaries so inflected forms ("vientos",
+# "tormentas") keep matching like the old substring checks did.
+_KW_RE = re.compile(r"(costeros|viento|lluvia|tormenta|nieve|temperatura)", re.IGNORECASE)
 
 
 class AEMETAlertPreprocessor:
@@ -22,23 +27,22 @@ class AEMETAlertPreprocessor:
         self.unique_key = self.cfg.get("unique_key", "identifier")
         self.serialization_rules = get_serialization_rules()
         self.output_schema = get_output_schema()
-        self.nlp = spacy.load("es_core_news_sm")
+        self.nlp = get_nlp("es_core_news_sm")
+        self._fresh_keys = []
         logging.info(f"Initialized NOAAAlertPreprocessor with input: {self.input_path}, output: {self.output_path}")
 
-    def extract_tags(self, event: str, headline: str, description: str) -> List[str]:
+    def extract_tags(self, doc, text: str) -> List[str]:
         """
-        Extract keywords or tags from event/headline/description using simple heuristics or NER.
+        Extract keywords or tags from the alert's combined text using simple heuristics or NER.
+
+        The doc comes from one batched nlp.pipe call over all alerts (see
+        process_alerts); this method only reads its entities.
         """
-        tags = set()
-        for txt in [event, headline, description]:
-            if not txt:
-                continue
-            doc = self.nlp(txt)
-            tags.update(ent.text.lower() for ent in doc.ents if ent.label_ in ("LOC", "MISC", "PER", "ORG"))
-            # También incluye palabras clave de fenómenos meteorológicos comunes
-            for w in ["costeros", "viento", "lluvia", "tormenta", "nieve", "temperatura"]:
-                if w in txt.lower():
-                    tags.add(w)
+        tags = set(ent.text.lower() for ent in doc.ents if ent.label_ in ("LOC", "MISC", "PER", "ORG"))
+        # También incluye palabras clave de fenómenos meteorológicos comunes:
+        # one scan of the compiled alternation instead of a lowercase plus
+        # substring pass per keyword.
+        tags.update(m.group(1).lower() for m in _KW_RE.finditer(text))
         return list(sorted(tags))
 
     def standardize_datetime(self, dt_string: str) -> str:
@@ -65,8 +69,7 @@ class AEMETAlertPreprocessor:
                     json_files = sorted(incremental_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
                     if json_files:
                         latest = json_files[0]
-                        with open(latest, "r", encoding="utf-8") as f:
-                            alerts = json.load(f)
+                        alerts = read_json(latest)
                         logging.info(f"Loaded {len(alerts)} incremental alerts from {latest}")
                         return alerts
                 logging.info("No incremental file found; skipping load because incremental=True.")
@@ -76,8 +79,7 @@ class AEMETAlertPreprocessor:
                 return []
         else:
             try:
-                with open(self.input_path, "r", encoding="utf-8") as f:
-                    alerts = json.load(f)
+                alerts = read_json(self.input_path)
                 logging.info(f"Loaded {len(alerts)} alerts from {self.input_path}")
                 return alerts
             except FileNotFoundError:
@@ -89,27 +91,24 @@ class AEMETAlertPreprocessor:
 
     def load_preprocessed_keys(self) -> set:
         """Load unique_keys from previous output, if exists."""
-        if not os.path.exists(self.output_path):
-            return set()
-        try:
-            with open(self.output_path, "r", encoding="utf-8") as f:
-                preprocessed = json.load(f)
-            logging.info(f"Loaded {len(preprocessed)} preprocessed alerts from {self.output_path}")
-            return set(alert.get(self.unique_key) for alert in preprocessed if self.unique_key in alert)
-        except Exception as e:
-            logging.warning(f"Could not read preprocessed file: {e}")
-            return set()
+        return load_output_keys(self.output_path, self.unique_key)
 
     def process_alerts(self, alerts: List[Dict]) -> List[Dict]:
         """Transform raw alerts into the standardized output format, skipping duplicates and filtering by relevance."""
         already_processed = self.load_preprocessed_keys()
+        fresh_keys = []
         processed = []
         # Define relevant severities and levels
         relevant_severities = {"Severe", "Extreme"}
         relevant_levels = {"naranja", "rojo"} 
+        # First pass: dedup and filter, collecting each surviving alert's
+        # combined text so NER can run over the whole batch in one nlp.pipe
+        # call instead of three single-doc calls per alert.
+        pending = []
+        texts = []
         for alert in alerts:
             key = alert.get(self.unique_key)
-            if key in already_processed:
+            if str(key) in already_processed:
                 continue
 
             # Filtering by severity and level
@@ -120,6 +119,13 @@ class AEMETAlertPreprocessor:
             if level not in relevant_levels:
                 continue
 
+            pending.append((alert, key, severity))
+            texts.append("\n".join(
+                txt for txt in (alert.get("event", ""), alert.get("headline", ""),
+                                alert.get("description", "")) if txt))
+
+        docs = self.nlp.pipe(texts, batch_size=128)
+        for (alert, key, severity), doc, text in zip(pending, docs, texts):
             title = alert.get("headline") or alert.get("event") or "AEMET Alert"
             description = (alert.get("description") or "").replace("\r\n", " ").replace("\n", " ").strip()
             event_datetime = self.standardize_datetime(alert.get("sent") or alert.get("onset"))
@@ -133,7 +139,7 @@ class AEMETAlertPreprocessor:
                 pass
             link = ""
             impacts = ""
-            tags = self.extract_tags(alert.get("event", ""), alert.get("headline", ""), alert.get("description", ""))
+            tags = self.extract_tags(doc, text)
             extra_data = {
                 "urgency": alert.get("urgency"),
                 "certainty": alert.get("certainty"),
@@ -163,31 +169,26 @@ class AEMETAlertPreprocessor:
             # Apply serialization rules efficiently
             for field in processed_alert.keys() & self.serialization_rules.keys():
                 if self.serialization_rules[field] == "json_string":
-                    processed_alert[field] = json.dumps(processed_alert[field], ensure_ascii=False)
+                    processed_alert[field] = orjson.dumps(processed_alert[field]).decode()
 
             # Build final alert dict with all fields in output schema
             final_alert = {field: processed_alert.get(field, None) for field in self.output_schema}
             
+            fresh_keys.append(str(key))
             processed.append(self.sanitize_for_chroma(final_alert))
             #logging.info(f"Processed new relevant alert with key: {key}")
 
+        self._fresh_keys = fresh_keys
         return processed
 
     def save_alerts(self, processed_alerts: List[Dict]):
-        """Append new processed alerts to output JSON file (if any)."""
+        """Append new processed alerts to the output JSON-Lines file (if any)."""
         if not processed_alerts:
             logging.info("No new alerts to preprocess.")
             return
-        # Carga los ya preprocesados (si existe) y concatena
-        if os.path.exists(self.output_path):
-            with open(self.output_path, "r", encoding="utf-8") as f:
-                previous = json.load(f)
-        else:
-            previous = []
-        all_alerts = previous + processed_alerts
-        with open(self.output_path, "w", encoding="utf-8") as f:
-            json.dump(all_alerts, f, ensure_ascii=False, indent=2)
-        logging.info(f"Saved {len(processed_alerts)} new preprocessed alerts. Total: {len(all_alerts)}.")
+        append_jsonl(self.output_path, processed_alerts)
+        append_seen_ids(f"{self.output_path}.keys", self._fresh_keys)
+        logging.info(f"Saved {len(processed_alerts)} new preprocessed alerts to {self.output_path}.")
 
     @staticmethod
     def sanitize_for_chroma(meta: dict) -> dict:
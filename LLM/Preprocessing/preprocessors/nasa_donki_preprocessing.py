@@ -1,10 +1,10 @@
-import json
+import orjson
 import re
 import logging
-import os
 from pathlib import Path
 from typing import List, Dict
 from config import get_source_config, get_source_input_path, get_source_output_path, get_output_schema, get_serialization_rules
+from utils import read_json, append_jsonl, append_seen_ids, load_output_keys
 
 class NASADONKIAlertPreprocessor:
     """
@@ -19,6 +19,7 @@ class NASADONKIAlertPreprocessor:
         self.timestamp_format = self.cfg.get("timestamp_format", "%Y-%m-%dT%H:%MZ")
         self.serialization_rules = get_serialization_rules()
         self.output_schema = get_output_schema()
+        self._fresh_keys = []
         logging.info(f"Initialized NASADONKIAlertPreprocessor with input: {self.input_path}, output: {self.output_path}")
 
     def load_alerts(self, incremental: bool = True) -> List[Dict]:
@@ -31,8 +32,7 @@ class NASADONKIAlertPreprocessor:
                     json_files = sorted(incremental_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
                     if json_files:
                         latest = json_files[0]
-                        with open(latest, "r", encoding="utf-8") as f:
-                            alerts = json.load(f)
+                        alerts = read_json(latest)
                         logging.info(f"Loaded {len(alerts)} incremental alerts from {latest}")
                         return alerts
                 logging.info("No incremental file found; skipping load because incremental=True.")
@@ -42,8 +42,7 @@ class NASADONKIAlertPreprocessor:
                 return []
         else:
             try:
-                with open(self.input_path, "r", encoding="utf-8") as f:
-                    alerts = json.load(f)
+                alerts = read_json(self.input_path)
                 logging.info(f"Loaded {len(alerts)} alerts from {self.input_path}")
                 return alerts
             except FileNotFoundError:
@@ -55,24 +54,16 @@ class NASADONKIAlertPreprocessor:
 
     def load_preprocessed_keys(self) -> set:
         """Load unique_keys from previous output, if exists."""
-        if not os.path.exists(self.output_path):
-            return set()
-        try:
-            with open(self.output_path, "r", encoding="utf-8") as f:
-                preprocessed = json.load(f)
-            logging.info(f"Loaded {len(preprocessed)} preprocessed alerts from {self.output_path}")
-            return set(alert.get(self.unique_key) for alert in preprocessed if self.unique_key in alert)
-        except Exception as e:
-            logging.warning(f"Could not read preprocessed file: {e}")
-            return set()
+        return load_output_keys(self.output_path, self.unique_key)
 
     def process_alerts(self, alerts: List[Dict]) -> List[Dict]:
         """Transform raw alerts into the standardized output format, skipping duplicates."""
         already_processed = self.load_preprocessed_keys()
+        fresh_keys = []
         processed = []
         for alert in alerts:
             key = alert.get(self.unique_key)
-            if key in already_processed:
+            if str(key) in already_processed:
                 continue
 
             body = (alert.get("body") or "").replace("\r\n", " ").replace("\n", " ").strip()
@@ -106,30 +97,26 @@ class NASADONKIAlertPreprocessor:
             # Apply serialization rules efficiently
             for field in processed_alert.keys() & self.serialization_rules.keys():
                 if self.serialization_rules[field] == "json_string":
-                    processed_alert[field] = json.dumps(processed_alert[field], ensure_ascii=False)
+                    processed_alert[field] = orjson.dumps(processed_alert[field]).decode()
 
             # Build final alert dict with all fields in output schema
             final_alert = {field: processed_alert.get(field, None) for field in self.output_schema}
 
+            fresh_keys.append(str(key))
             processed.append(self.sanitize_for_chroma(final_alert))
   
             #logging.info(f"Processed new alert with key: {key}")
+        self._fresh_keys = fresh_keys
         return processed
 
     def save_alerts(self, processed_alerts: List[Dict]):
-        """Append new processed alerts to output JSON file (if any)."""
+        """Append new processed alerts to the output JSON-Lines file (if any)."""
         if not processed_alerts:
             logging.info("No new alerts to preprocess.")
             return
-        if os.path.exists(self.output_path):
-            with open(self.output_path, "r", encoding="utf-8") as f:
-                previous = json.load(f)
-        else:
-            previous = []
-        all_alerts = previous + processed_alerts
-        with open(self.output_path, "w", encoding="utf-8") as f:
-            json.dump(all_alerts, f, ensure_ascii=False, indent=2)
-        logging.info(f"Saved {len(processed_alerts)} new preprocessed alerts. Total: {len(all_alerts)}.")
+        append_jsonl(self.output_path, processed_alerts)
+        append_seen_ids(f"{self.output_path}.keys", self._fresh_keys)
+        logging.info(f"Saved {len(processed_alerts)} new preprocessed alerts to {self.output_path}.")
 
     @staticmethod
     def extract_links(body: str) -> List[str]:
@@ -1,11 +1,10 @@
-import json
+import orjson
 import re
-import spacy
-import os
 import logging
 from pathlib import Path
 from typing import List, Dict
-from config import get_source_config, get_source_input_path, get_source_output_path, get_serialization_rules, get_output_schema
+from config import get_source_config, get_source_input_path, get_source_output_path, get_serialization_rules, get_output_schema, get_nlp
+from utils import read_json, append_jsonl, append_seen_ids, load_output_keys
 
 class NOAAAlertPreprocessor:
     """
@@ -23,23 +22,24 @@ class NOAAAlertPreprocessor:
         self.unique_key = self.cfg.get("unique_key", "issue_datetime")
         self.serialization_rules = get_serialization_rules()
         self.output_schema = get_output_schema()
-        self.nlp = spacy.load("en_core_web_sm") 
+        self.nlp = get_nlp("en_core_web_sm")
+        self._fresh_keys = []
         logging.info(f"Initialized NOAAAlertPreprocessor with input: {self.input_path}, output: {self.output_path}")
 
-    def extract_location(self, impacts: str, message: str = "") -> str:
+    def extract_location(self, fulltext: str, doc) -> str:
         """
-        Extract relevant location info from impacts/message.
+        Extract relevant location info from the combined impacts/message text.
         Uses spaCy NER for place/entity extraction, plus geomagnetic patterns.
-        """
-        fulltext = impacts + " " + message
 
+        The doc comes from one batched nlp.pipe call over all alerts (see
+        process_alerts); this method only reads its entities.
+        """
         # 1. Geomagnetic Latitude
         lat_match = re.search(r"(\d+)\s*degrees? Geomagnetic Latitude", fulltext, re.IGNORECASE)
         if lat_match:
             return f"Poleward of {lat_match.group(1)} degrees Geomagnetic Latitude"
 
         # 2. Use spaCy to extract GPE (Geo-Political Entities: countries, cities, etc.)
-        doc = self.nlp(fulltext)
         places = [ent.text for ent in doc.ents if ent.label_ in ("GPE", "LOC")]
         if places:
             return ", ".join(sorted(set(places)))
@@ -57,7 +57,14 @@ class NOAAAlertPreprocessor:
         """Convert NOAA datetime string to ISO 8601 format (UTC)."""
         from datetime import datetime
         try:
-            dt = datetime.strptime(dt_string, self.timestamp_format)
+            # NOAA stamps ("%Y-%m-%d %H:%M:%S.%f") are ISO-shaped, so the
+            # C-implemented fromisoformat parses them without strptime's
+            # per-call format interpretation; strptime stays as the
+            # fallback for stamps that only match the configured format.
+            try:
+                dt = datetime.fromisoformat(dt_string)
+            except ValueError:
+                dt = datetime.strptime(dt_string, self.timestamp_format)
             return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
         except Exception as e:
             logging.warning(f"Failed to standardize datetime: {dt_string} | {e}")
@@ -73,8 +80,7 @@ class NOAAAlertPreprocessor:
                     json_files = sorted(incremental_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
                     if json_files:
                         latest = json_files[0]
-                        with open(latest, "r", encoding="utf-8") as f:
-                            alerts = json.load(f)
+                        alerts = read_json(latest)
                         logging.info(f"Loaded {len(alerts)} incremental alerts from {latest}")
                         return alerts
                 logging.info("No incremental file found; skipping load because incremental=True.")
@@ -84,8 +90,7 @@ class NOAAAlertPreprocessor:
                 return []
         else:
             try:
-                with open(self.input_path, "r", encoding="utf-8") as f:
-                    alerts = json.load(f)
+                alerts = read_json(self.input_path)
                 logging.info(f"Loaded {len(alerts)} alerts from {self.input_path}")
                 return alerts
             except FileNotFoundError:
@@ -97,28 +102,30 @@ class NOAAAlertPreprocessor:
 
     def load_preprocessed_keys(self) -> set:
         """Load unique_keys from previous output, if exists."""
-        if not os.path.exists(self.output_path):
-            return set()
-        try:
-            with open(self.output_path, "r", encoding="utf-8") as f:
-                preprocessed = json.load(f)
-            logging.info(f"Loaded {len(preprocessed)} preprocessed alerts from {self.output_path}")
-            return set(alert.get(self.unique_key) for alert in preprocessed if self.unique_key in alert)
-        except Exception as e:
-            logging.warning(f"Could not read preprocessed file: {e}")
-            return set()
+        return load_output_keys(self.output_path, self.unique_key)
         
     def process_alerts(self, alerts: List[Dict]) -> List[Dict]:
         """Transform raw alerts into the standardized output format, skipping duplicates."""
         already_processed = self.load_preprocessed_keys()
+        fresh_keys = []
         processed = []
+        # First pass: dedup and collect each surviving alert's combined
+        # text, so NER runs over the whole batch in one nlp.pipe call
+        # instead of a single-doc call per alert.
+        pending = []
+        fulltexts = []
         for alert in alerts:
             key = alert.get(self.unique_key)
-            if key in already_processed:
+            if str(key) in already_processed:
                 continue
 
             message = (alert.get("message") or "").replace("\r\n", " ").replace("\n", " ").strip()
             impacts = (alert.get("impacts") or "").replace("\r\n", " ").replace("\n", " ").strip()
+            pending.append((alert, key, message, impacts))
+            fulltexts.append(impacts + " " + message)
+
+        docs = self.nlp.pipe(fulltexts, batch_size=128)
+        for (alert, key, message, impacts), doc, fulltext in zip(pending, docs, fulltexts):
             event_datetime = self.standardize_datetime(alert.get("issue_datetime", ""))
             magnitude = alert.get("k_index")
             try:
@@ -132,7 +139,7 @@ class NOAAAlertPreprocessor:
                 "title": message.split(".")[0] if message else "NOAA Alert",
                 "description": message,
                 "event_datetime": event_datetime,
-                "location": self.extract_location(impacts, message),
+                "location": self.extract_location(fulltext, doc),
                 "severity": None,
                 "magnitude": magnitude,
                 "link": "https://www.swpc.noaa.gov/noaa-scales-explanation",
@@ -142,28 +149,24 @@ class NOAAAlertPreprocessor:
             # Apply serialization rules efficiently
             for field in processed_alert.keys() & self.serialization_rules.keys():
                 if self.serialization_rules[field] == "json_string":
-                    processed_alert[field] = json.dumps(processed_alert[field], ensure_ascii=False)
+                    processed_alert[field] = orjson.dumps(processed_alert[field]).decode()
 
             # Build final alert dict with all fields in output schema
             final_alert = {field: processed_alert.get(field, None) for field in self.output_schema}
 
+            fresh_keys.append(str(key))
             processed.append(self.sanitize_for_chroma(final_alert))
+        self._fresh_keys = fresh_keys
         return processed
 
     def save_alerts(self, processed_alerts: List[Dict]):
-        """Append new processed alerts to output JSON file (if any)."""
+        """Append new processed alerts to the output JSON-Lines file (if any)."""
         if not processed_alerts:
             logging.info("No new alerts to preprocess.")
             return
-        if os.path.exists(self.output_path):
-            with open(self.output_path, "r", encoding="utf-8") as f:
-                previous = json.load(f)
-        else:
-            previous = []
-        all_alerts = previous + processed_alerts
-        with open(self.output_path, "w", encoding="utf-8") as f:
-            json.dump(all_alerts, f, ensure_ascii=False, indent=2)
-        logging.info(f"Saved {len(processed_alerts)} new preprocessed alerts. Total: {len(all_alerts)}.")
+        append_jsonl(self.output_path, processed_alerts)
+        append_seen_ids(f"{self.output_path}.keys", self._fresh_keys)
+        logging.info(f"Saved {len(processed_alerts)} new preprocessed alerts to {self.output_path}.")
 
     @staticmethod
     def sanitize_for_chroma(meta: dict) -> dict:
@@ -1,9 +1,9 @@
-import json
-import os
+import orjson
 import logging
 from pathlib import Path
 from typing import List, Dict
 from config import get_source_config, get_source_input_path, get_source_output_path, get_serialization_rules, get_output_schema
+from utils import read_json, append_jsonl, append_seen_ids, load_output_keys
 
 class USGSEarthquakePreprocessor:
     """
@@ -18,6 +18,7 @@ class USGSEarthquakePreprocessor:
         self.timestamp_format = self.cfg.get("timestamp_format", "%Y-%m-%d %H:%M:%S UTC")
         self.serialization_rules = get_serialization_rules()
         self.output_schema = get_output_schema()
+        self._fresh_keys = []
         logging.info(f"Initialized USGSEarthquakePreprocessor with input: {self.input_path}, output: {self.output_path}")
 
     def load_alerts(self, incremental: bool = True) -> List[Dict]:
@@ -30,8 +31,7 @@ class USGSEarthquakePreprocessor:
                     json_files = sorted(incremental_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
                     if json_files:
                         latest = json_files[0]
-                        with open(latest, "r", encoding="utf-8") as f:
-                            alerts = json.load(f)
+                        alerts = read_json(latest)
                         logging.info(f"Loaded {len(alerts)} incremental alerts from {latest}")
                         return alerts
                 logging.info("No incremental file found; skipping load because incremental=True.")
@@ -41,8 +41,7 @@ class USGSEarthquakePreprocessor:
                 return []
         else:
             try:
-                with open(self.input_path, "r", encoding="utf-8") as f:
-                    alerts = json.load(f)
+                alerts = read_json(self.input_path)
                 logging.info(f"Loaded {len(alerts)} alerts from {self.input_path}")
                 return alerts
             except FileNotFoundError:
@@ -54,16 +53,7 @@ class USGSEarthquakePreprocessor:
 
     def load_preprocessed_keys(self) -> set:
         """Load unique_keys from previous output, if exists."""
-        if not os.path.exists(self.output_path):
-            return set()
-        try:
-            with open(self.output_path, "r", encoding="utf-8") as f:
-                preprocessed = json.load(f)
-            logging.info(f"Loaded {len(preprocessed)} preprocessed alerts from {self.output_path}")
-            return set(alert.get(self.unique_key) for alert in preprocessed if self.unique_key in alert)
-        except Exception as e:
-            logging.warning(f"Could not read preprocessed file: {e}")
-            return set()
+        return load_output_keys(self.output_path, self.unique_key)
 
     def standardize_datetime(self, dt_string: str) -> str:
         """Convert USGS datetime string to ISO 8601 format (UTC)."""
@@ -78,10 +68,11 @@ class USGSEarthquakePreprocessor:
     def process_alerts(self, alerts: List[Dict]) -> List[Dict]:
         """Transform raw alerts into the standardized output format, skipping duplicates."""
         already_processed = self.load_preprocessed_keys()
+        fresh_keys = []
         processed = []
         for alert in alerts:
             key = alert.get(self.unique_key)
-            if key in already_processed:
+            if str(key) in already_processed:
                 continue
 
             event_datetime = self.standardize_datetime(alert.get("event_datetime", ""))
@@ -128,29 +119,25 @@ class USGSEarthquakePreprocessor:
             # Apply serialization rules efficiently
             for field in processed_alert.keys() & self.serialization_rules.keys():
                 if self.serialization_rules[field] == "json_string":
-                    processed_alert[field] = json.dumps(processed_alert[field], ensure_ascii=False)
+                    processed_alert[field] = orjson.dumps(processed_alert[field]).decode()
 
             # Build final alert dict with all fields in output schema
             final_alert = {field: processed_alert.get(field, None) for field in self.output_schema}
             
+            fresh_keys.append(str(key))
             processed.append(self.sanitize_for_chroma(final_alert))
             #logging.info(f"Processed new alert with key: {key}")
+        self._fresh_keys = fresh_keys
         return processed
 
     def save_alerts(self, processed_alerts: List[Dict]):
-        """Append new processed alerts to output JSON file (if any)."""
+        """Append new processed alerts to the output JSON-Lines file (if any)."""
         if not processed_alerts:
             logging.info("No new alerts to preprocess.")
             return
-        if os.path.exists(self.output_path):
-            with open(self.output_path, "r", encoding="utf-8") as f:
-                previous = json.load(f)
-        else:
-            previous = []
-        all_alerts = previous + processed_alerts
-        with open(self.output_path, "w", encoding="utf-8") as f:
-            json.dump(all_alerts, f, ensure_ascii=False, indent=2)
-        logging.info(f"Saved {len(processed_alerts)} new preprocessed alerts. Total: {len(all_alerts)}.")
+        append_jsonl(self.output_path, processed_alerts)
+        append_seen_ids(f"{self.output_path}.keys", self._fresh_keys)
+        logging.info(f"Saved {len(processed_alerts)} new preprocessed alerts to {self.output_path}.")
 
     @staticmethod
     def sanitize_for_chroma(meta: dict) -> dict:
@@ -0,0 +1,132 @@
+# utils.py – Shared I/O helpers for the preprocessors
+
+import logging
+import os
+from pathlib import Path
+
+import orjson
+
+
+def read_json(file_path):
+    """
+    Read a JSON file into Python objects.
+
+    orjson decodes the raw bytes in one C call, so loading a feed costs a
+    single read plus parse instead of the stdlib's pure-Python token loop
+    over a text-mode stream.
+
+    Args:
+        file_path: Path to the JSON file.
+
+    Returns:
+        The parsed JSON content (usually a list of alert dicts).
+    """
+    with open(file_path, "rb") as f:
+        _advise_sequential(f)
+        return orjson.loads(f.read())
+
+
+def _advise_sequential(f):
+    """Hint the kernel that f will be read front to back, so it issues
+    aggressive readahead; a no-op on platforms without posix_fadvise."""
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
+def append_jsonl(file_path, records):
+    """
+    Append records to a JSON-Lines file, one orjson-encoded object per line.
+
+    Appending is O(new records) per run; the previous read-concatenate-
+    rewrite cycle re-serialized the whole archive every time. The explicit
+    buffer batches the per-record writes into ~1 MiB flushes.
+
+    Args:
+        file_path: Path to the .jsonl file.
+        records (list): Record dicts to append.
+    """
+    with open(file_path, "ab", buffering=1024 * 1024) as f:
+        f.writelines(orjson.dumps(record) + b"\n" for record in records)
+
+
+def iter_jsonl(file_path):
+    """
+    Yield records from a JSON-Lines file, one parsed object per line.
+
+    Args:
+        file_path: Path to the .jsonl file.
+
+    Yields:
+        dict: The next record in the file.
+    """
+    with open(file_path, "rb") as f:
+        _advise_sequential(f)
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
+
+
+def load_seen_ids(file_path):
+    """
+    Load the key-per-line sidecar index into a set.
+
+    Returns None when the index does not exist yet, so callers can tell
+    "no index" apart from "empty index".
+    """
+    if not os.path.exists(file_path):
+        return None
+    with open(file_path, "r", encoding="utf-8") as f:
+        return {line.rstrip("\n") for line in f if line.strip()}
+
+
+def append_seen_ids(file_path, ids):
+    """Append ids to the key-per-line sidecar index."""
+    if not ids:
+        return
+    with open(file_path, "a", encoding="utf-8") as f:
+        f.writelines(f"{i}\n" for i in ids)
+
+
+def _collect_keys(keys, alerts, unique_key):
+    """Add each alert's key to the set; the output schema stores it under
+    the generic "unique_key" field, so that is checked as a fallback."""
+    for alert in alerts:
+        key = alert.get(unique_key) or alert.get("unique_key")
+        if key:
+            keys.add(str(key))
+
+
+def load_output_keys(output_path, unique_key):
+    """
+    Return the set of keys already present in a preprocessed output file.
+
+    Keys come from the key-per-line sidecar index when it exists: a plain
+    line read with no JSON parsing, so membership data stays cheap even
+    when the output archive has grown to many MB. Without a sidecar the
+    keys are rebuilt once from the output file (and any pre-switch .json
+    archive next to it) and the index is written so the rebuild never
+    repeats.
+
+    Args:
+        output_path: Path to the .jsonl output file.
+        unique_key (str): Source-specific key field name.
+
+    Returns:
+        set: Keys (as strings) of records already written.
+    """
+    index_path = f"{output_path}.keys"
+    keys = load_seen_ids(index_path)
+    if keys is not None:
+        return keys
+    keys = set()
+    try:
+        if os.path.exists(output_path):
+            _collect_keys(keys, iter_jsonl(output_path), unique_key)
+        legacy = Path(output_path).with_suffix(".json")
+        if legacy.exists():
+            _collect_keys(keys, read_json(legacy), unique_key)
+    except Exception as e:
+        logging.warning(f"Could not read preprocessed file {output_path}: {e}")
+        return keys
+    append_seen_ids(index_path, sorted(keys))
+    return keys
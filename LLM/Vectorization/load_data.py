@@ -25,5 +25,15 @@ class AlertLoader:
             except Exception as e:
                 if logger:
                     logger.warning(f"Failed to load {filepath}: {e}")
+        # Preprocessed outputs are JSON-Lines since the append-only switch:
+        # one object per line, parsed line by line.
+        pattern = os.path.join(self.input_path, '*.jsonl')
+        for filepath in glob.iglob(pattern, recursive=True):
+            try:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    alerts.extend(json.loads(line) for line in f if line.strip())
+            except Exception as e:
+                if logger:
+                    logger.warning(f"Failed to load {filepath}: {e}")
         return alerts
 